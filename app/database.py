@@ -1,109 +1,252 @@
 """
 In-memory database implementation for the Fitness Studio Booking API.
 """
+import itertools
+from array import array
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
-import pytz
+from typing import List, NamedTuple, Optional, Dict, Any, Set, Tuple
 from .models import FitnessClass, Booking
-from .utils import generate_booking_id
-from data.seed_data import FITNESS_CLASSES, SAMPLE_CLIENTS, generate_sample_schedule
+from .utils import IST, now_ist
+from data import seed_data
+
+
+@dataclass
+class ClassColumns:
+    """Column-oriented storage for fitness classes (one list per field)."""
+    ids: List[int] = field(default_factory=list)
+    names: List[str] = field(default_factory=list)
+    date_times: List[datetime] = field(default_factory=list)
+    instructors: List[str] = field(default_factory=list)
+    available_slots: array = field(default_factory=lambda: array('i'))
+    total_slots: array = field(default_factory=lambda: array('i'))
+    # Per-class mutation counter, bumped whenever the row changes
+    versions: array = field(default_factory=lambda: array('Q'))
+    id_to_index: Dict[int, int] = field(default_factory=dict)
+
+    def append(self, class_id: int, name: str, date_time: datetime,
+               instructor: str, available_slots: int, total_slots: int):
+        """Append one class row across all columns."""
+        self.id_to_index[class_id] = len(self.ids)
+        self.ids.append(class_id)
+        self.names.append(name)
+        self.date_times.append(date_time)
+        self.instructors.append(instructor)
+        self.available_slots.append(available_slots)
+        self.total_slots.append(total_slots)
+        self.versions.append(0)
+
+    def to_model(self, index: int) -> FitnessClass:
+        """Materialize a FitnessClass from a column index (no re-validation)."""
+        return FitnessClass.model_construct(
+            id=self.ids[index],
+            name=self.names[index],
+            date_time=self.date_times[index],
+            instructor=self.instructors[index],
+            available_slots=self.available_slots[index],
+            total_slots=self.total_slots[index],
+            timezone="Asia/Kolkata"
+        )
+
+
+@dataclass
+class BookingColumns:
+    """Column-oriented storage for bookings (one list per field)."""
+    ids: List[int] = field(default_factory=list)
+    class_ids: List[int] = field(default_factory=list)
+    class_names: List[str] = field(default_factory=list)
+    client_names: List[str] = field(default_factory=list)
+    client_emails: List[str] = field(default_factory=list)
+    booking_dates: List[datetime] = field(default_factory=list)
+    created_ats: List[datetime] = field(default_factory=list)
+    id_to_index: Dict[int, int] = field(default_factory=dict)
+
+    def append(self, booking_id: int, class_id: int, class_name: str,
+               client_name: str, client_email: str, booking_date: datetime,
+               created_at: datetime):
+        """Append one booking row across all columns."""
+        self.id_to_index[booking_id] = len(self.ids)
+        self.ids.append(booking_id)
+        self.class_ids.append(class_id)
+        self.class_names.append(class_name)
+        self.client_names.append(client_name)
+        self.client_emails.append(client_email)
+        self.booking_dates.append(booking_date)
+        self.created_ats.append(created_at)
+
+    def to_model(self, index: int) -> Booking:
+        """Materialize a Booking from a column index (no re-validation)."""
+        return Booking.model_construct(
+            id=self.ids[index],
+            class_id=self.class_ids[index],
+            class_name=self.class_names[index],
+            client_name=self.client_names[index],
+            client_email=self.client_emails[index],
+            booking_date=self.booking_dates[index],
+            created_at=self.created_ats[index]
+        )
+
+
+class BookingResult(NamedTuple):
+    """Outcome of an atomic booking attempt."""
+    status: str  # 'ok', 'not_found', 'full' or 'duplicate'
+    booking_id: Optional[int]
+    fitness_class: Optional[FitnessClass]
 
 
 class InMemoryDatabase:
     """In-memory database for storing fitness classes and bookings."""
-    
+
     def __init__(self):
-        self.classes: Dict[int, FitnessClass] = {}
-        self.bookings: Dict[int, Booking] = {}
-        self.next_booking_id = 1
+        self.classes = ClassColumns()
+        self.bookings = BookingColumns()
+        self._booking_id_counter = itertools.count(1)
+        # Bumped on any class mutation; lets readers cache serialized payloads
+        self.classes_etag = 0
+        # Indexes for O(1) booking lookups (keyed by lowercased email)
+        self._bookings_by_email: Dict[str, List[int]] = {}
+        self._booking_keys: Set[Tuple[int, str]] = set()
         self._initialize_data()
-    
+
     def _initialize_data(self):
         """Initialize the database with sample data."""
-        ist_tz = pytz.timezone('Asia/Kolkata')
-        now = datetime.now(ist_tz)
-        
         # Generate sample schedule for next 7 days
-        schedule = generate_sample_schedule(7)
-        
+        schedule = seed_data.generate_sample_schedule(7)
+
+        # Class templates by name for O(1) lookup
+        fitness_classes = seed_data.FITNESS_CLASSES
+        templates = {c['name']: c for c in fitness_classes}
+
         # Create fitness classes
         class_id = 1
         for class_data in schedule:
-            # Parse datetime string and make it timezone-aware
-            date_time_str = class_data['date_time']
-            if '+' in date_time_str:
-                # Already timezone-aware
-                date_time = datetime.fromisoformat(date_time_str)
-            else:
-                # Make it timezone-aware
-                date_time = datetime.fromisoformat(date_time_str)
-                date_time = ist_tz.localize(date_time)
-            
+            # Parse datetime string; seed timestamps carry their offset so
+            # this normally yields an aware datetime in a single parse
+            date_time = datetime.fromisoformat(class_data['date_time'])
+            if date_time.tzinfo is None:
+                # Naive fallback: assume IST (pytz needs localize here)
+                date_time = IST.localize(date_time)
+
             # Find class template
-            class_template = next(
-                (c for c in FITNESS_CLASSES if c['name'] == class_data['name']), 
-                FITNESS_CLASSES[0]
-            )
-            
-            fitness_class = FitnessClass(
-                id=class_id,
+            class_template = templates.get(class_data['name'], fitness_classes[0])
+
+            self.classes.append(
+                class_id=class_id,
                 name=class_data['name'],
                 date_time=date_time,
                 instructor=class_data['instructor'],
                 available_slots=class_template['max_capacity'],
-                total_slots=class_template['max_capacity'],
-                timezone="Asia/Kolkata"
+                total_slots=class_template['max_capacity']
             )
-            
-            self.classes[class_id] = fitness_class
             class_id += 1
-    
+
     def get_all_classes(self) -> List[FitnessClass]:
         """Get all fitness classes."""
-        return list(self.classes.values())
-    
+        return [self.classes.to_model(i) for i in range(len(self.classes.ids))]
+
     def get_class_by_id(self, class_id: int) -> Optional[FitnessClass]:
         """Get a fitness class by ID."""
-        return self.classes.get(class_id)
-    
+        index = self.classes.id_to_index.get(class_id)
+        if index is None:
+            return None
+        return self.classes.to_model(index)
+
+    def get_class_version(self, class_id: int) -> Optional[int]:
+        """Get the mutation counter for a class (None if not found)."""
+        index = self.classes.id_to_index.get(class_id)
+        if index is None:
+            return None
+        return self.classes.versions[index]
+
+    def get_available_class_ids(self) -> List[int]:
+        """Get the IDs of all classes that still have open slots."""
+        slots = self.classes.available_slots
+        ids = self.classes.ids
+        return [ids[i] for i in range(len(ids)) if slots[i] > 0]
+
+    def count_full_classes(self) -> int:
+        """Count classes with no remaining slots in one pass over the column."""
+        return sum(1 for s in self.classes.available_slots if s <= 0)
+
     def update_class_slots(self, class_id: int, available_slots: int):
         """Update available slots for a class."""
-        if class_id in self.classes:
-            self.classes[class_id].available_slots = available_slots
-    
-    def create_booking(self, class_id: int, class_name: str, client_name: str, 
+        index = self.classes.id_to_index.get(class_id)
+        if index is not None:
+            self.classes.available_slots[index] = available_slots
+            self.classes.versions[index] += 1
+            self.classes_etag += 1
+
+    def create_booking(self, class_id: int, class_name: str, client_name: str,
                       client_email: str, booking_date: datetime) -> int:
-        """Create a new booking."""
-        booking_id = self.next_booking_id
-        self.next_booking_id += 1
-        
-        booking = Booking(
-            id=booking_id,
+        """Create a new booking.
+
+        The email is lowercased once here to key the lookup indexes;
+        callers going through BookingRequest already pass a normalized
+        address.
+        """
+        booking_id = next(self._booking_id_counter)
+
+        self.bookings.append(
+            booking_id=booking_id,
             class_id=class_id,
             class_name=class_name,
             client_name=client_name,
             client_email=client_email,
             booking_date=booking_date,
-            created_at=datetime.now(pytz.timezone('Asia/Kolkata'))
+            created_at=now_ist()
         )
-        
-        self.bookings[booking_id] = booking
+
+        # Maintain the lookup indexes
+        email_key = client_email.lower()
+        self._bookings_by_email.setdefault(email_key, []).append(booking_id)
+        self._booking_keys.add((class_id, email_key))
+
         return booking_id
-    
+
+    def try_book(self, class_id: int, client_name: str, client_email: str) -> BookingResult:
+        """
+        Atomically validate and book a class in a single operation.
+
+        Performs the class lookup, full-class check, duplicate check, slot
+        decrement and booking insert together, so the booking path needs one
+        database call instead of four and the check and the decrement cannot
+        race.
+        """
+        index = self.classes.id_to_index.get(class_id)
+        if index is None:
+            return BookingResult('not_found', None, None)
+
+        fitness_class = self.classes.to_model(index)
+
+        if self.classes.available_slots[index] <= 0:
+            return BookingResult('full', None, fitness_class)
+
+        if (class_id, client_email.lower()) in self._booking_keys:
+            return BookingResult('duplicate', None, fitness_class)
+
+        booking_id = self.create_booking(
+            class_id=class_id,
+            class_name=fitness_class.name,
+            client_name=client_name,
+            client_email=client_email,
+            booking_date=fitness_class.date_time
+        )
+        self.classes.available_slots[index] -= 1
+        self.classes.versions[index] += 1
+        self.classes_etag += 1
+
+        return BookingResult('ok', booking_id, fitness_class)
+
     def get_bookings_by_email(self, email: str) -> List[Booking]:
         """Get all bookings for a specific email."""
         return [
-            booking for booking in self.bookings.values()
-            if booking.client_email.lower() == email.lower()
+            self.bookings.to_model(self.bookings.id_to_index[booking_id])
+            for booking_id in self._bookings_by_email.get(email.lower(), ())
         ]
-    
+
     def check_existing_booking(self, class_id: int, client_email: str) -> bool:
         """Check if a client has already booked a specific class."""
-        for booking in self.bookings.values():
-            if (booking.class_id == class_id and 
-                booking.client_email.lower() == client_email.lower()):
-                return True
-        return False
+        return (class_id, client_email.lower()) in self._booking_keys
 
 
 # Global database instance
@@ -115,4 +258,4 @@ def get_db() -> InMemoryDatabase:
     global _db_instance
     if _db_instance is None:
         _db_instance = InMemoryDatabase()
-    return _db_instance 
\ No newline at end of file
+    return _db_instance
@@ -3,7 +3,7 @@ Main FastAPI application for the Fitness Studio Booking API.
 """
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from typing import List
 import logging
 
@@ -26,7 +26,8 @@ app = FastAPI(
     description="A comprehensive booking API for a fictional fitness studio",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -38,10 +39,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Get service instance
-fitness_service = get_fitness_service()
-
-
 @app.get("/", tags=["Health"])
 async def root():
     """Health check endpoint."""
@@ -61,10 +58,14 @@ async def get_classes():
     name, date/time, instructor, and available slots.
     """
     try:
-        classes = fitness_service.get_all_classes()
-        return ClassesResponse(classes=classes)
+        etag, body = get_fitness_service().get_classes_response()
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={"ETag": f'"{etag}"'}
+        )
     except Exception as e:
-        logger.error(f"Error in get_classes endpoint: {str(e)}")
+        logger.error("Error in get_classes endpoint: %s", str(e))
         raise HTTPException(
             status_code=500,
             detail="Failed to retrieve classes. Please try again."
@@ -80,22 +81,22 @@ async def book_class(booking_request: BookingRequest):
     Validates availability and creates the booking if slots are available.
     """
     try:
-        response = fitness_service.book_class(booking_request)
+        response = get_fitness_service().book_class(booking_request)
         return response
     except ValueError as e:
-        logger.warning(f"Booking validation error: {str(e)}")
+        logger.warning("Booking validation error: %s", str(e))
         raise HTTPException(
             status_code=409,
             detail=str(e)
         )
     except KeyError as e:
-        logger.warning(f"Class not found: {str(e)}")
+        logger.warning("Class not found: %s", str(e))
         raise HTTPException(
             status_code=404,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Error in book_class endpoint: {str(e)}")
+        logger.error("Error in book_class endpoint: %s", str(e))
         raise HTTPException(
             status_code=500,
             detail="Failed to create booking. Please try again."
@@ -110,10 +111,10 @@ async def get_bookings(email: str = Query(..., description="Client email address
     Returns all bookings made by the specified email address.
     """
     try:
-        bookings = fitness_service.get_bookings_by_email(email)
+        bookings = get_fitness_service().get_bookings_by_email(email)
         return BookingsResponse(bookings=bookings)
     except Exception as e:
-        logger.error(f"Error in get_bookings endpoint: {str(e)}")
+        logger.error("Error in get_bookings endpoint: %s", str(e))
         raise HTTPException(
             status_code=500,
             detail="Failed to retrieve bookings. Please try again."
@@ -128,7 +129,7 @@ async def get_class_details(class_id: int):
     Returns detailed information about a specific fitness class.
     """
     try:
-        fitness_class = fitness_service.get_class_details(class_id)
+        fitness_class = get_fitness_service().get_class_details(class_id)
         if not fitness_class:
             raise HTTPException(
                 status_code=404,
@@ -138,7 +139,7 @@ async def get_class_details(class_id: int):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in get_class_details endpoint: {str(e)}")
+        logger.error("Error in get_class_details endpoint: %s", str(e))
         raise HTTPException(
             status_code=500,
             detail="Failed to retrieve class details. Please try again."
@@ -153,10 +154,10 @@ async def check_class_availability(class_id: int):
     Returns availability information for a specific fitness class.
     """
     try:
-        availability = fitness_service.check_class_availability(class_id)
+        availability = get_fitness_service().check_class_availability(class_id)
         return availability
     except Exception as e:
-        logger.error(f"Error in check_class_availability endpoint: {str(e)}")
+        logger.error("Error in check_class_availability endpoint: %s", str(e))
         raise HTTPException(
             status_code=500,
             detail="Failed to check class availability. Please try again."
@@ -167,7 +168,7 @@ async def check_class_availability(class_id: int):
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler for unhandled exceptions."""
-    logger.error(f"Unhandled exception: {str(exc)}")
+    logger.error("Unhandled exception: %s", str(exc))
     return JSONResponse(
         status_code=500,
         content={
@@ -1,10 +1,16 @@
 """
 Pydantic models for the Fitness Studio Booking API.
 """
+import re
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, EmailStr, Field, validator
-import pytz
+from pydantic import BaseModel, Field, validator
+
+from .utils import IST, now_ist, validate_email
+
+# Letters-and-spaces name check, compiled once ([^\W\d_] matches any unicode
+# letter)
+_NAME_RE = re.compile(r'^[^\W\d_]+(?:\s+[^\W\d_]+)*$')
 
 
 class FitnessClass(BaseModel):
@@ -19,14 +25,18 @@ class FitnessClass(BaseModel):
 
     @validator('date_time')
     def validate_future_date(cls, v):
-        """Ensure class is in the future."""
-        ist_tz = pytz.timezone('Asia/Kolkata')
-        now = datetime.now(ist_tz)
-        
+        """Ensure class is in the future.
+
+        Only runs on validated construction (seeding and tests); read paths
+        materialize instances via model_construct and skip this check, so no
+        datetime.now call happens per row per response.
+        """
+        now = now_ist()
+
         # If datetime is naive, assume it's in IST
         if v.tzinfo is None:
-            v = ist_tz.localize(v)
-        
+            v = IST.localize(v)
+
         if v < now:
             raise ValueError('Class date must be in the future')
         return v
@@ -48,14 +58,23 @@ class BookingRequest(BaseModel):
     """Model for booking request data."""
     class_id: int = Field(..., gt=0)
     client_name: str = Field(..., min_length=1, max_length=100)
-    client_email: EmailStr
+    client_email: str
+
+    @validator('client_email')
+    def validate_client_email(cls, v):
+        """Validate and normalize the client email address."""
+        v = v.strip().lower()
+        if not validate_email(v):
+            raise ValueError('Invalid email address')
+        return v
 
     @validator('client_name')
     def validate_client_name(cls, v):
         """Ensure client name contains only letters and spaces."""
-        if not all(c.isalpha() or c.isspace() for c in v):
+        v = v.strip()
+        if not _NAME_RE.match(v):
             raise ValueError('Client name must contain only letters and spaces')
-        return v.strip()
+        return v
 
 
 class Booking(BaseModel):
@@ -2,9 +2,8 @@
 Business logic services for the Fitness Studio Booking API.
 """
 from datetime import datetime
-from typing import List, Optional
-import pytz
-from .models import FitnessClass, Booking, BookingRequest, BookingResponse
+from typing import List, Optional, Tuple
+from .models import FitnessClass, Booking, BookingRequest, BookingResponse, ClassesResponse
 from .database import get_db
 from .utils import setup_logging, is_class_full, calculate_available_slots
 
@@ -16,7 +15,11 @@ class FitnessStudioService:
     
     def __init__(self):
         self.db = get_db()
-    
+        # Cached (etag, serialized /classes payload), rebuilt when classes change
+        self._classes_cache: Optional[Tuple[int, bytes]] = None
+        # Availability payloads keyed by class_id -> (version, slots, payload)
+        self._availability_cache: dict = {}
+
     def get_all_classes(self) -> List[FitnessClass]:
         """
         Get all upcoming fitness classes.
@@ -26,12 +29,32 @@ class FitnessStudioService:
         """
         try:
             classes = self.db.get_all_classes()
-            logger.info(f"Successfully retrieved {len(classes)} classes")
+            logger.info("Successfully retrieved %d classes", len(classes))
             return classes
         except Exception as e:
-            logger.error(f"Error retrieving classes: {str(e)}")
+            logger.error("Error retrieving classes: %s", str(e))
             raise
     
+    def get_classes_response(self) -> Tuple[int, bytes]:
+        """
+        Get the serialized /classes payload with its etag.
+
+        The JSON body is cached and reused until a class mutation bumps the
+        database etag, so repeated reads skip model construction and
+        serialization entirely.
+
+        Returns:
+            Tuple of (etag, JSON-encoded payload bytes)
+        """
+        etag = self.db.classes_etag
+        cached = self._classes_cache
+        if cached is None or cached[0] != etag:
+            classes = self.get_all_classes()
+            body = ClassesResponse(classes=classes).model_dump_json().encode()
+            cached = (etag, body)
+            self._classes_cache = cached
+        return cached
+
     def book_class(self, booking_request: BookingRequest) -> BookingResponse:
         """
         Book a fitness class.
@@ -47,53 +70,41 @@ class FitnessStudioService:
             KeyError: If class not found
         """
         try:
-            # Get the class details
-            fitness_class = self.db.get_class_by_id(booking_request.class_id)
-            if not fitness_class:
-                logger.warning(f"Class {booking_request.class_id} not found")
-                raise KeyError(f"Class with ID {booking_request.class_id} not found")
-            
-            # Check if class is full
-            if is_class_full(fitness_class.available_slots):
-                logger.warning(f"Class {booking_request.class_id} is full")
-                raise ValueError("This class is full. No available slots.")
-            
-            # Check if client has already booked this class
-            if self.db.check_existing_booking(booking_request.class_id, booking_request.client_email):
-                logger.warning(f"Client {booking_request.client_email} already booked class {booking_request.class_id}")
-                raise ValueError("You have already booked this class.")
-            
-            # Create the booking
-            booking_id = self.db.create_booking(
+            # Look up, validate and book in a single database operation
+            result = self.db.try_book(
                 class_id=booking_request.class_id,
-                class_name=fitness_class.name,
                 client_name=booking_request.client_name,
-                client_email=booking_request.client_email,
-                booking_date=fitness_class.date_time
+                client_email=booking_request.client_email
             )
-            
-            # Update available slots
-            new_available_slots = fitness_class.available_slots - 1
-            self.db.update_class_slots(booking_request.class_id, new_available_slots)
-            
-            # Create response
-            response = BookingResponse(
-                booking_id=booking_id,
-                class_name=fitness_class.name,
+
+            if result.status == 'not_found':
+                logger.warning("Class %s not found", booking_request.class_id)
+                raise KeyError(f"Class with ID {booking_request.class_id} not found")
+            if result.status == 'full':
+                logger.warning("Class %s is full", booking_request.class_id)
+                raise ValueError("This class is full. No available slots.")
+            if result.status == 'duplicate':
+                logger.warning("Client %s already booked class %s", booking_request.client_email, booking_request.class_id)
+                raise ValueError("You have already booked this class.")
+
+            # Create response (values are already validated, skip re-validation)
+            response = BookingResponse.model_construct(
+                booking_id=result.booking_id,
+                class_name=result.fitness_class.name,
                 client_name=booking_request.client_name,
                 client_email=booking_request.client_email,
-                booking_date=fitness_class.date_time,
+                booking_date=result.fitness_class.date_time,
                 message="Booking successful!"
             )
-            
-            logger.info(f"Successfully created booking {booking_id} for class {booking_request.class_id}")
+
+            logger.info("Successfully created booking %d for class %s", result.booking_id, booking_request.class_id)
             return response
-            
+
         except (ValueError, KeyError):
             # Re-raise these specific exceptions
             raise
         except Exception as e:
-            logger.error(f"Error creating booking: {str(e)}")
+            logger.error("Error creating booking: %s", str(e))
             raise ValueError("Failed to create booking. Please try again.")
     
     def get_bookings_by_email(self, email: str) -> List[Booking]:
@@ -108,10 +119,10 @@ class FitnessStudioService:
         """
         try:
             bookings = self.db.get_bookings_by_email(email)
-            logger.info(f"Successfully retrieved {len(bookings)} bookings for {email}")
+            logger.info("Successfully retrieved %d bookings for %s", len(bookings), email)
             return bookings
         except Exception as e:
-            logger.error(f"Error retrieving bookings for {email}: {str(e)}")
+            logger.error("Error retrieving bookings for %s: %s", email, str(e))
             raise
     
     def get_class_details(self, class_id: int) -> Optional[FitnessClass]:
@@ -127,12 +138,12 @@ class FitnessStudioService:
         try:
             fitness_class = self.db.get_class_by_id(class_id)
             if fitness_class:
-                logger.info(f"Retrieved details for class {class_id}")
+                logger.info("Retrieved details for class %s", class_id)
             else:
-                logger.warning(f"Class {class_id} not found")
+                logger.warning("Class %s not found", class_id)
             return fitness_class
         except Exception as e:
-            logger.error(f"Error retrieving class {class_id}: {str(e)}")
+            logger.error("Error retrieving class %s: %s", class_id, str(e))
             raise
     
     def check_class_availability(self, class_id: int) -> dict:
@@ -154,10 +165,17 @@ class FitnessStudioService:
                     "available_slots": 0,
                     "total_slots": 0
                 }
-            
+
+            # Reuse the cached payload while the class is unchanged (version
+            # bumps on every mutation); availability polling is repetitive
+            version = self.db.get_class_version(class_id)
+            cached = self._availability_cache.get(class_id)
+            if cached and cached[0] == version and cached[1] == fitness_class.available_slots:
+                return cached[2]
+
             is_available = not is_class_full(fitness_class.available_slots)
-            
-            return {
+
+            availability = {
                 "available": is_available,
                 "message": "Class is full" if not is_available else "Slots available",
                 "available_slots": fitness_class.available_slots,
@@ -165,16 +183,24 @@ class FitnessStudioService:
                 "class_name": fitness_class.name,
                 "date_time": fitness_class.date_time
             }
-            
+            self._availability_cache[class_id] = (
+                version, fitness_class.available_slots, availability
+            )
+            return availability
+
         except Exception as e:
-            logger.error(f"Error checking availability for class {class_id}: {str(e)}")
+            logger.error("Error checking availability for class %s: %s", class_id, str(e))
             raise
 
 
-# Global service instance
-fitness_service = FitnessStudioService()
+# Global service instance, created lazily so importing this module doesn't
+# trigger database seeding
+_service_instance = None
 
 
 def get_fitness_service() -> FitnessStudioService:
     """Get the fitness studio service instance."""
-    return fitness_service 
\ No newline at end of file
+    global _service_instance
+    if _service_instance is None:
+        _service_instance = FitnessStudioService()
+    return _service_instance 
\ No newline at end of file
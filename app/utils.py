@@ -1,27 +1,58 @@
 """
 Utility functions for the Fitness Studio Booking API.
 """
+import functools
+import html
+import itertools
 import logging
+import re
 import pytz
 from datetime import datetime
 from typing import Optional
 import os
 
+# Precompiled email pattern (compiling per call would pay re's cache lookup
+# on every validation)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 
+# Default timezone, constructed once (pytz.timezone does a dict lookup and
+# string normalization on every call)
+IST = pytz.timezone('Asia/Kolkata')
+
+# Memoized timezone lookup for arbitrary timezone names
+_get_timezone = functools.lru_cache(maxsize=64)(pytz.timezone)
+
+
+def now_ist() -> datetime:
+    """Get the current time in the default (IST) timezone."""
+    return datetime.now(IST)
+
+
+@functools.lru_cache(maxsize=1)
 def setup_logging() -> logging.Logger:
-    """Setup structured logging for the application."""
+    """Setup structured logging for the application.
+
+    Cached so that every module importing this gets the same configured
+    logger instead of re-running handler setup (and re-opening the log
+    file) on each import.
+    """
     log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
-    
-    logging.basicConfig(
-        level=getattr(logging, log_level),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler('fitness_studio.log')
-        ]
-    )
-    
-    return logging.getLogger(__name__)
+
+    logger = logging.getLogger('fitness_studio')
+    if not logger.handlers:
+        logger.setLevel(getattr(logging, log_level))
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        # delay=True defers opening the file until the first record is written
+        file_handler = logging.FileHandler('fitness_studio.log', delay=True)
+        file_handler.setFormatter(formatter)
+        logger.addHandler(stream_handler)
+        logger.addHandler(file_handler)
+
+    return logger
 
 
 def get_timezone() -> str:
@@ -43,10 +74,10 @@ def convert_timezone(dt: datetime, from_tz: str, to_tz: str) -> datetime:
     """
     if dt.tzinfo is None:
         # If datetime is naive, assume it's in the source timezone
-        source_tz = pytz.timezone(from_tz)
+        source_tz = _get_timezone(from_tz)
         dt = source_tz.localize(dt)
-    
-    target_tz = pytz.timezone(to_tz)
+
+    target_tz = _get_timezone(to_tz)
     return dt.astimezone(target_tz)
 
 
@@ -77,9 +108,7 @@ def validate_email(email: str) -> bool:
     Returns:
         True if email is valid, False otherwise
     """
-    import re
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 
 def sanitize_string(s: str) -> str:
@@ -92,20 +121,21 @@ def sanitize_string(s: str) -> str:
     Returns:
         Sanitized string
     """
-    import html
     return html.escape(s.strip())
 
 
+_booking_id_counter = itertools.count(1)
+
+
 def generate_booking_id() -> int:
     """
     Generate a unique booking ID.
     In a real application, this would use a database sequence.
-    
+
     Returns:
         Unique booking ID
     """
-    import time
-    return int(time.time() * 1000)
+    return next(_booking_id_counter)
 
 
 def is_class_full(available_slots: int) -> bool:
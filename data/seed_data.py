@@ -2,110 +2,39 @@
 Sample data for the Fitness Studio Booking API.
 This file contains sample fitness classes and instructors.
 """
+import functools
+import json
 from datetime import datetime, timedelta
+from pathlib import Path
+from types import MappingProxyType
 import pytz
 
-# Sample instructors
-INSTRUCTORS = [
-    {
-        "name": "Sarah Johnson",
-        "specialties": ["Yoga", "Pilates", "Meditation"],
-        "experience": "8 years",
-        "certifications": ["RYT-500", "Pilates Mat", "Meditation Teacher"]
-    },
-    {
-        "name": "Maria Rodriguez",
-        "specialties": ["Zumba", "Latin Dance", "Cardio"],
-        "experience": "5 years",
-        "certifications": ["Zumba Basic", "Zumba Toning", "Latin Dance Instructor"]
-    },
-    {
-        "name": "Mike Chen",
-        "specialties": ["HIIT", "Strength Training", "CrossFit"],
-        "experience": "6 years",
-        "certifications": ["NASM CPT", "CrossFit Level 2", "HIIT Specialist"]
-    },
-    {
-        "name": "Emma Wilson",
-        "specialties": ["Spinning", "Cycling", "Endurance Training"],
-        "experience": "4 years",
-        "certifications": ["Spinning Instructor", "Cycling Coach", "Endurance Specialist"]
-    },
-    {
-        "name": "David Thompson",
-        "specialties": ["Boxing", "Kickboxing", "Self-Defense"],
-        "experience": "10 years",
-        "certifications": ["Boxing Coach", "Kickboxing Instructor", "Self-Defense Expert"]
-    }
-]
+# IST timezone object, resolved once at import (pytz.timezone probes the
+# zoneinfo database on lookup)
+_IST = pytz.timezone('Asia/Kolkata')
+
+
+# The bulky seed constants live in seed_data.json and are loaded lazily, so a
+# cold import of this module stays cheap; INSTRUCTORS, FITNESS_CLASSES,
+# SAMPLE_CLIENTS and SAMPLE_BOOKINGS are still reachable as module attributes
+# via __getattr__ below
+_SEED_DATA_PATH = Path(__file__).with_name("seed_data.json")
+_SEED_DATA_KEYS = ("INSTRUCTORS", "FITNESS_CLASSES", "SAMPLE_CLIENTS", "SAMPLE_BOOKINGS")
+
+
+@functools.lru_cache(maxsize=1)
+def _load_seed_data():
+    """Load the seed constants from JSON on first access."""
+    with open(_SEED_DATA_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def __getattr__(name):
+    """Lazily expose the JSON-backed seed constants as module attributes."""
+    if name in _SEED_DATA_KEYS:
+        return _load_seed_data()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Sample fitness classes
-FITNESS_CLASSES = [
-    {
-        "name": "Yoga Flow",
-        "description": "A dynamic vinyasa flow class that builds strength and flexibility",
-        "duration": 60,
-        "difficulty": "Beginner to Intermediate",
-        "max_capacity": 20,
-        "instructor": "Sarah Johnson"
-    },
-    {
-        "name": "Zumba Fitness",
-        "description": "High-energy dance fitness class with Latin rhythms",
-        "duration": 45,
-        "difficulty": "All Levels",
-        "max_capacity": 25,
-        "instructor": "Maria Rodriguez"
-    },
-    {
-        "name": "HIIT Circuit",
-        "description": "High-intensity interval training with strength and cardio",
-        "duration": 30,
-        "difficulty": "Intermediate to Advanced",
-        "max_capacity": 15,
-        "instructor": "Mike Chen"
-    },
-    {
-        "name": "Spinning",
-        "description": "Indoor cycling class with music and motivation",
-        "duration": 45,
-        "difficulty": "All Levels",
-        "max_capacity": 18,
-        "instructor": "Emma Wilson"
-    },
-    {
-        "name": "Boxing Basics",
-        "description": "Learn boxing fundamentals and get a great workout",
-        "duration": 60,
-        "difficulty": "Beginner",
-        "max_capacity": 12,
-        "instructor": "David Thompson"
-    },
-    {
-        "name": "Pilates Mat",
-        "description": "Core strengthening and body awareness through Pilates",
-        "duration": 45,
-        "difficulty": "All Levels",
-        "max_capacity": 16,
-        "instructor": "Sarah Johnson"
-    },
-    {
-        "name": "Kickboxing",
-        "description": "High-energy kickboxing class for cardio and strength",
-        "duration": 60,
-        "difficulty": "Intermediate",
-        "max_capacity": 14,
-        "instructor": "David Thompson"
-    },
-    {
-        "name": "Latin Dance",
-        "description": "Learn salsa, bachata, and merengue moves",
-        "duration": 60,
-        "difficulty": "Beginner to Intermediate",
-        "max_capacity": 20,
-        "instructor": "Maria Rodriguez"
-    }
-]
 
 # Sample time slots
 TIME_SLOTS = [
@@ -114,165 +43,123 @@ TIME_SLOTS = [
     "18:00", "19:00", "20:00", "21:00"
 ]
 
-# Sample clients for testing
-SAMPLE_CLIENTS = [
-    {
-        "name": "John Doe",
-        "email": "john.doe@example.com",
-        "phone": "+1-555-0101",
-        "membership_type": "Premium"
-    },
-    {
-        "name": "Jane Smith",
-        "email": "jane.smith@example.com",
-        "phone": "+1-555-0102",
-        "membership_type": "Standard"
-    },
-    {
-        "name": "Mike Johnson",
-        "email": "mike.johnson@example.com",
-        "phone": "+1-555-0103",
-        "membership_type": "Premium"
-    },
-    {
-        "name": "Sarah Wilson",
-        "email": "sarah.wilson@example.com",
-        "phone": "+1-555-0104",
-        "membership_type": "Standard"
-    },
-    {
-        "name": "David Brown",
-        "email": "david.brown@example.com",
-        "phone": "+1-555-0105",
-        "membership_type": "Premium"
-    }
-]
 
-# Sample bookings for testing
-SAMPLE_BOOKINGS = [
-    {
-        "class_id": 1,
-        "client_name": "John Doe",
-        "client_email": "john.doe@example.com",
-        "booking_date": "2024-01-15T10:00:00+05:30"
-    },
-    {
-        "class_id": 2,
-        "client_name": "Jane Smith",
-        "client_email": "jane.smith@example.com",
-        "booking_date": "2024-01-15T14:00:00+05:30"
-    },
-    {
-        "class_id": 3,
-        "client_name": "Mike Johnson",
-        "client_email": "mike.johnson@example.com",
-        "booking_date": "2024-01-15T18:00:00+05:30"
-    }
-]
+def _parse_time_slots(slots):
+    """Parse "HH:MM" strings into (hour, minute) int tuples."""
+    return tuple((int(h), int(m)) for h, m in (s.split(":") for s in slots))
+
+
+# Schedule time slots pre-parsed to (hour, minute) tuples at import time
+_MORNING_HM = _parse_time_slots(["06:00", "07:00", "08:00", "09:00", "10:00", "11:00"])
+_AFTERNOON_HM = _parse_time_slots(["14:00", "15:00", "16:00", "17:00"])
+_EVENING_HM = _parse_time_slots(["18:00", "19:00", "20:00"])
+
+# Constant seconds+offset suffix for schedule timestamps
+_TS_SUFFIX = ":00+05:30"
 
+# Daily schedule template: (time slots, prebuilt class dict). Morning is
+# capped at 3 classes per day, afternoon and evening at 2; only date_time
+# varies per slot, so each entry is cloned with the timestamp filled in.
+_SCHEDULE_TEMPLATE = (
+    (_MORNING_HM[:3], {"name": "Yoga Flow", "instructor": "Sarah Johnson",
+                       "available_slots": 20, "total_slots": 20}),
+    (_AFTERNOON_HM[:2], {"name": "Zumba Fitness", "instructor": "Maria Rodriguez",
+                         "available_slots": 25, "total_slots": 25}),
+    (_EVENING_HM[:2], {"name": "HIIT Circuit", "instructor": "Mike Chen",
+                       "available_slots": 15, "total_slots": 15}),
+)
 
+# The same template flattened to per-slot (hour, minute, class dict) entries,
+# so schedule generation can run as a single comprehension
+_SCHEDULE_TEMPLATE_FLAT = tuple(
+    (hour, minute, template)
+    for times, template in _SCHEDULE_TEMPLATE
+    for hour, minute in times
+)
+
+@functools.lru_cache(maxsize=16)
 def generate_sample_schedule(days_ahead=7):
     """
     Generate a sample class schedule for the next N days.
-    
+
+    Cached per days_ahead for the lifetime of the process ("now" is frozen
+    at first call); callers must not mutate the returned list.
+
     Args:
         days_ahead: Number of days to generate schedule for
-        
+
     Returns:
         List of class schedules
     """
-    ist_tz = pytz.timezone('Asia/Kolkata')
-    now = datetime.now(ist_tz)
-    schedule = []
-    
-    for day in range(1, days_ahead + 1):
-        class_date = now + timedelta(days=day)
-        
-        # Morning classes (6 AM - 12 PM)
-        morning_times = ["06:00", "07:00", "08:00", "09:00", "10:00", "11:00"]
-        for time_slot in morning_times[:3]:  # Limit to 3 morning classes per day
-            hour, minute = map(int, time_slot.split(":"))
-            class_datetime = class_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            
-            schedule.append({
-                "name": "Yoga Flow",
-                "date_time": class_datetime.isoformat(),
-                "instructor": "Sarah Johnson",
-                "available_slots": 20,
-                "total_slots": 20
-            })
-        
-        # Afternoon classes (2 PM - 6 PM)
-        afternoon_times = ["14:00", "15:00", "16:00", "17:00"]
-        for time_slot in afternoon_times[:2]:  # Limit to 2 afternoon classes per day
-            hour, minute = map(int, time_slot.split(":"))
-            class_datetime = class_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            
-            schedule.append({
-                "name": "Zumba Fitness",
-                "date_time": class_datetime.isoformat(),
-                "instructor": "Maria Rodriguez",
-                "available_slots": 25,
-                "total_slots": 25
-            })
-        
-        # Evening classes (6 PM - 9 PM)
-        evening_times = ["18:00", "19:00", "20:00"]
-        for time_slot in evening_times[:2]:  # Limit to 2 evening classes per day
-            hour, minute = map(int, time_slot.split(":"))
-            class_datetime = class_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            
-            schedule.append({
-                "name": "HIIT Circuit",
-                "date_time": class_datetime.isoformat(),
-                "instructor": "Mike Chen",
-                "available_slots": 15,
-                "total_slots": 15
-            })
-    
-    return schedule
+    now = datetime.now(_IST)
+
+    # Date portion and IST offset are constant per day; precompute one
+    # prefix per day and build the whole schedule in a single comprehension
+    # over the flattened slot template
+    day_prefixes = [
+        (now + timedelta(days=day)).strftime("%Y-%m-%dT")
+        for day in range(1, days_ahead + 1)
+    ]
+    return [
+        {**template, "date_time": f"{date_prefix}{hour:02d}:{minute:02d}{_TS_SUFFIX}"}
+        for date_prefix in day_prefixes
+        for hour, minute, template in _SCHEDULE_TEMPLATE_FLAT
+    ]
+
+
+# Name -> record lookup tables, built on first use and wrapped read-only so
+# nothing can regress them back to mutable scan targets
+@functools.lru_cache(maxsize=1)
+def _instructors_by_name():
+    return MappingProxyType({i["name"]: i for i in _load_seed_data()["INSTRUCTORS"]})
+
+
+@functools.lru_cache(maxsize=1)
+def _classes_by_name():
+    return MappingProxyType({c["name"]: c for c in _load_seed_data()["FITNESS_CLASSES"]})
 
 
+@functools.lru_cache(maxsize=None)
 def get_instructor_by_name(name):
     """
     Get instructor details by name.
-    
+
+    Cached; callers must not mutate the returned dict.
+
     Args:
         name: Instructor name
-        
+
     Returns:
         Instructor details or None if not found
     """
-    for instructor in INSTRUCTORS:
-        if instructor["name"] == name:
-            return instructor
-    return None
+    return _instructors_by_name().get(name)
 
 
+@functools.lru_cache(maxsize=None)
 def get_class_by_name(name):
     """
     Get class details by name.
-    
+
+    Cached; callers must not mutate the returned dict.
+
     Args:
         name: Class name
-        
+
     Returns:
         Class details or None if not found
     """
-    for class_info in FITNESS_CLASSES:
-        if class_info["name"] == name:
-            return class_info
-    return None
+    return _classes_by_name().get(name)
 
 
 if __name__ == "__main__":
     # Print sample data for reference
+    seed = _load_seed_data()
     print("=== Sample Instructors ===")
-    for instructor in INSTRUCTORS:
+    for instructor in seed["INSTRUCTORS"]:
         print(f"- {instructor['name']}: {', '.join(instructor['specialties'])}")
     
     print("\n=== Sample Classes ===")
-    for class_info in FITNESS_CLASSES:
+    for class_info in seed["FITNESS_CLASSES"]:
         print(f"- {class_info['name']}: {class_info['description']}")
     
     print("\n=== Sample Schedule (Next 3 days) ===")
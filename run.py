@@ -7,34 +7,59 @@ import os
 import sys
 from pathlib import Path
 
-# Add the project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+# Add the project root to Python path (only when not already there, so
+# reload cycles don't pile up duplicate entries)
+project_root = str(Path(__file__).resolve().parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 def main():
     """Main function to start the FastAPI application."""
     # Configuration
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8000"))
-    reload = os.getenv("RELOAD", "true").lower() == "true"
+    reload = os.getenv("RELOAD", "false").lower() == "true"
+    access_log = os.getenv("ACCESS_LOG", "false").lower() == "true"
     log_level = os.getenv("LOG_LEVEL", "info").lower()
     
+    # Multi-worker mode is opt-in: each worker process seeds its own
+    # InMemoryDatabase, so scaling workers shards bookings across processes.
+    # Reload also implies a single worker (uvicorn's reloader is
+    # incompatible with multi-worker mode).
+    workers = 1 if reload else int(os.getenv("WORKERS", "1"))
+
     print("🏋️  Starting Fitness Studio Booking API...")
     print(f"📍 Host: {host}")
     print(f"🚀 Port: {port}")
     print(f"🔄 Reload: {reload}")
+    print(f"👷 Workers: {workers}")
     print(f"📝 Log Level: {log_level}")
     print("=" * 50)
-    
-    # Start the server
-    uvicorn.run(
-        "app.main:app",
-        host=host,
-        port=port,
-        reload=reload,
-        log_level=log_level,
-        access_log=True
-    )
+
+    # Start the server on uvloop (C event loop) and httptools (C HTTP
+    # parser) instead of the slower pure-Python defaults
+    if reload:
+        uvicorn.run(
+            "app.main:app",
+            host=host,
+            port=port,
+            reload=True,
+            log_level=log_level,
+            access_log=access_log,
+            loop="uvloop",
+            http="httptools"
+        )
+    else:
+        uvicorn.run(
+            "app.main:app",
+            host=host,
+            port=port,
+            workers=workers,
+            log_level=log_level,
+            access_log=access_log,
+            loop="uvloop",
+            http="httptools"
+        )
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
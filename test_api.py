@@ -3,20 +3,24 @@
 Simple test script to verify the Fitness Studio Booking API functionality.
 """
 import requests
-import json
+import orjson
 import time
 from datetime import datetime
 
 # API base URL
 BASE_URL = "http://localhost:8000"
 
+# Shared session so requests reuse one keep-alive connection
+SESSION = requests.Session()
+SESSION.headers.update({"Content-Type": "application/json"})
+
 def test_health_check():
     """Test the health check endpoint."""
     print("🏥 Testing health check...")
     try:
-        response = requests.get(f"{BASE_URL}/")
+        response = SESSION.get(f"{BASE_URL}/")
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"✅ Health check passed: {data['message']}")
             return True
         else:
@@ -30,9 +34,9 @@ def test_get_classes():
     """Test getting all classes."""
     print("\n📚 Testing get classes...")
     try:
-        response = requests.get(f"{BASE_URL}/classes")
+        response = SESSION.get(f"{BASE_URL}/classes")
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             classes = data.get('classes', [])
             print(f"✅ Found {len(classes)} classes")
             for i, class_info in enumerate(classes[:3], 1):
@@ -61,9 +65,9 @@ def test_book_class(classes):
     }
     
     try:
-        response = requests.post(f"{BASE_URL}/book", json=booking_data)
+        response = SESSION.post(f"{BASE_URL}/book", json=booking_data)
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"✅ Booking successful: {data['message']}")
             print(f"   Booking ID: {data['booking_id']}")
             print(f"   Class: {data['class_name']}")
@@ -80,9 +84,9 @@ def test_get_bookings():
     """Test getting bookings by email."""
     print(f"\n📋 Testing get bookings...")
     try:
-        response = requests.get(f"{BASE_URL}/bookings?email=test@example.com")
+        response = SESSION.get(f"{BASE_URL}/bookings?email=test@example.com")
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             bookings = data.get('bookings', [])
             print(f"✅ Found {len(bookings)} bookings for test@example.com")
             for booking in bookings:
@@ -105,9 +109,9 @@ def test_class_details(classes):
     class_info = classes[0]
     
     try:
-        response = requests.get(f"{BASE_URL}/classes/{class_info['id']}")
+        response = SESSION.get(f"{BASE_URL}/classes/{class_info['id']}")
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"✅ Class details retrieved: {data['name']}")
             print(f"   Instructor: {data['instructor']}")
             print(f"   Available slots: {data['available_slots']}/{data['total_slots']}")
@@ -129,9 +133,9 @@ def test_class_availability(classes):
     class_info = classes[0]
     
     try:
-        response = requests.get(f"{BASE_URL}/classes/{class_info['id']}/availability")
+        response = SESSION.get(f"{BASE_URL}/classes/{class_info['id']}/availability")
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"✅ Availability checked: {data['class_name']}")
             print(f"   Available: {data['available']}")
             print(f"   Slots: {data['available_slots']}/{data['total_slots']}")
@@ -149,7 +153,7 @@ def test_error_handling():
     
     # Test booking non-existent class
     try:
-        response = requests.post(f"{BASE_URL}/book", json={
+        response = SESSION.post(f"{BASE_URL}/book", json={
             "class_id": 99999,
             "client_name": "Test User",
             "client_email": "test@example.com"
@@ -163,7 +167,7 @@ def test_error_handling():
     
     # Test invalid email
     try:
-        response = requests.post(f"{BASE_URL}/book", json={
+        response = SESSION.post(f"{BASE_URL}/book", json={
             "class_id": 1,
             "client_name": "Test User",
             "client_email": "invalid-email"
@@ -180,29 +184,37 @@ def main():
     print("🧪 Fitness Studio Booking API Test Suite")
     print("=" * 50)
     
-    # Wait a moment for server to start
+    # Poll until the server answers instead of sleeping a fixed warmup
     print("⏳ Waiting for server to be ready...")
-    time.sleep(2)
-    
-    # Run tests
-    tests = [
-        ("Health Check", test_health_check),
-        ("Get Classes", lambda: test_get_classes()),
-        ("Class Details", lambda: test_class_details(test_get_classes())),
-        ("Class Availability", lambda: test_class_availability(test_get_classes())),
-        ("Book Class", lambda: test_book_class(test_get_classes())),
-        ("Get Bookings", test_get_bookings),
-        ("Error Handling", test_error_handling),
-    ]
-    
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            if SESSION.get(f"{BASE_URL}/", timeout=0.1).status_code == 200:
+                break
+        except requests.RequestException:
+            pass
+        time.sleep(0.05)
+
     results = []
-    for test_name, test_func in tests:
+
+    def run(test_name, test_func):
         try:
             result = test_func()
             results.append((test_name, result is not False))
+            return result
         except Exception as e:
             print(f"❌ {test_name} failed with exception: {e}")
             results.append((test_name, False))
+            return None
+
+    # Run tests (fetch the class list once and share it with dependent tests)
+    run("Health Check", test_health_check)
+    classes = run("Get Classes", test_get_classes) or []
+    run("Class Details", lambda: test_class_details(classes))
+    run("Class Availability", lambda: test_class_availability(classes))
+    run("Book Class", lambda: test_book_class(classes))
+    run("Get Bookings", test_get_bookings)
+    run("Error Handling", test_error_handling)
     
     # Summary
     print("\n" + "=" * 50)
@@ -0,0 +1,47 @@
+"""
+Shared pytest fixtures for the test suite.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import FitnessStudioService
+
+
+@pytest.fixture(scope="session")
+def service():
+    """One service instance shared by the whole session.
+
+    Tests that need to stub its db swap the attribute via monkeypatch,
+    which restores the original at test end.
+    """
+    return FitnessStudioService()
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Session-wide TestClient, so app startup runs once for the suite."""
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def classes(client):
+    """The /classes payload, fetched once and shared across tests."""
+    return client.get("/classes").json()["classes"]
+
+
+@pytest.fixture(scope="session")
+def booked_email(client, classes):
+    """An email with one booking on the first class, created once per run.
+
+    Tests that just need "some existing booking" consume this instead of
+    re-POSTing their own.
+    """
+    email = "alice@example.com"
+    if classes:
+        client.post("/book", json={
+            "class_id": classes[0]["id"],
+            "client_name": "Alice Smith",
+            "client_email": email
+        })
+    return email
@@ -1,20 +1,12 @@
 """
 Tests for the main FastAPI application endpoints.
 """
-import pytest
-from fastapi.testclient import TestClient
-from datetime import datetime, timedelta
-import pytz
-
-from app.main import app
-
-client = TestClient(app)
 
 
 class TestHealthEndpoint:
     """Test health check endpoint."""
     
-    def test_root_endpoint(self):
+    def test_root_endpoint(self, client):
         """Test the root health check endpoint."""
         response = client.get("/")
         assert response.status_code == 200
@@ -27,7 +19,7 @@ class TestHealthEndpoint:
 class TestClassesEndpoint:
     """Test classes endpoint."""
     
-    def test_get_classes(self):
+    def test_get_classes(self, client):
         """Test getting all classes."""
         response = client.get("/classes")
         assert response.status_code == 200
@@ -42,12 +34,8 @@ class TestClassesEndpoint:
             for field in required_fields:
                 assert field in class_data
     
-    def test_get_class_details_valid_id(self):
+    def test_get_class_details_valid_id(self, client, classes):
         """Test getting class details with valid ID."""
-        # First get all classes to get a valid ID
-        response = client.get("/classes")
-        classes = response.json()["classes"]
-        
         if classes:
             class_id = classes[0]["id"]
             response = client.get(f"/classes/{class_id}")
@@ -55,18 +43,14 @@ class TestClassesEndpoint:
             data = response.json()
             assert data["id"] == class_id
     
-    def test_get_class_details_invalid_id(self):
+    def test_get_class_details_invalid_id(self, client):
         """Test getting class details with invalid ID."""
         response = client.get("/classes/99999")
         assert response.status_code == 404
         assert "not found" in response.json()["detail"]
     
-    def test_check_class_availability_valid_id(self):
+    def test_check_class_availability_valid_id(self, client, classes):
         """Test checking class availability with valid ID."""
-        # First get all classes to get a valid ID
-        response = client.get("/classes")
-        classes = response.json()["classes"]
-        
         if classes:
             class_id = classes[0]["id"]
             response = client.get(f"/classes/{class_id}/availability")
@@ -76,7 +60,7 @@ class TestClassesEndpoint:
             assert "available_slots" in data
             assert "total_slots" in data
     
-    def test_check_class_availability_invalid_id(self):
+    def test_check_class_availability_invalid_id(self, client):
         """Test checking class availability with invalid ID."""
         response = client.get("/classes/99999/availability")
         assert response.status_code == 200
@@ -88,12 +72,8 @@ class TestClassesEndpoint:
 class TestBookingEndpoint:
     """Test booking endpoint."""
     
-    def test_book_class_valid_request(self):
+    def test_book_class_valid_request(self, client, classes):
         """Test booking a class with valid request."""
-        # First get all classes to get a valid ID
-        response = client.get("/classes")
-        classes = response.json()["classes"]
-        
         if classes:
             class_id = classes[0]["id"]
             booking_data = {
@@ -111,7 +91,7 @@ class TestBookingEndpoint:
             assert data["client_email"] == "john@example.com"
             assert "successful" in data["message"]
     
-    def test_book_class_invalid_class_id(self):
+    def test_book_class_invalid_class_id(self, client):
         """Test booking a class with invalid class ID."""
         booking_data = {
             "class_id": 99999,
@@ -123,12 +103,8 @@ class TestBookingEndpoint:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"]
     
-    def test_book_class_invalid_email(self):
+    def test_book_class_invalid_email(self, client, classes):
         """Test booking a class with invalid email."""
-        # First get all classes to get a valid ID
-        response = client.get("/classes")
-        classes = response.json()["classes"]
-        
         if classes:
             class_id = classes[0]["id"]
             booking_data = {
@@ -140,7 +116,7 @@ class TestBookingEndpoint:
             response = client.post("/book", json=booking_data)
             assert response.status_code == 422  # Validation error
     
-    def test_book_class_missing_fields(self):
+    def test_book_class_missing_fields(self, client):
         """Test booking a class with missing fields."""
         booking_data = {
             "class_id": 1
@@ -150,12 +126,8 @@ class TestBookingEndpoint:
         response = client.post("/book", json=booking_data)
         assert response.status_code == 422  # Validation error
     
-    def test_book_class_duplicate_booking(self):
+    def test_book_class_duplicate_booking(self, client, classes):
         """Test booking the same class twice with same email."""
-        # First get all classes to get a valid ID
-        response = client.get("/classes")
-        classes = response.json()["classes"]
-        
         if classes:
             class_id = classes[0]["id"]
             booking_data = {
@@ -177,36 +149,21 @@ class TestBookingEndpoint:
 class TestBookingsEndpoint:
     """Test bookings endpoint."""
     
-    def test_get_bookings_valid_email(self):
+    def test_get_bookings_valid_email(self, client, booked_email):
         """Test getting bookings for valid email."""
-        # First create a booking
-        response = client.get("/classes")
-        classes = response.json()["classes"]
-        
-        if classes:
-            class_id = classes[0]["id"]
-            booking_data = {
-                "class_id": class_id,
-                "client_name": "Alice Smith",
-                "client_email": "alice@example.com"
-            }
-            
-            # Create booking
-            client.post("/book", json=booking_data)
-            
-            # Get bookings for the email
-            response = client.get("/bookings?email=alice@example.com")
-            assert response.status_code == 200
-            data = response.json()
-            assert "bookings" in data
-            assert isinstance(data["bookings"], list)
-            
-            if data["bookings"]:
-                booking = data["bookings"][0]
-                assert booking["client_email"] == "alice@example.com"
-                assert booking["client_name"] == "Alice Smith"
+        # Get bookings for the email (booked once by the session fixture)
+        response = client.get(f"/bookings?email={booked_email}")
+        assert response.status_code == 200
+        data = response.json()
+        assert "bookings" in data
+        assert isinstance(data["bookings"], list)
+
+        if data["bookings"]:
+            booking = data["bookings"][0]
+            assert booking["client_email"] == booked_email
+            assert booking["client_name"] == "Alice Smith"
     
-    def test_get_bookings_no_bookings(self):
+    def test_get_bookings_no_bookings(self, client):
         """Test getting bookings for email with no bookings."""
         response = client.get("/bookings?email=nonexistent@example.com")
         assert response.status_code == 200
@@ -214,7 +171,7 @@ class TestBookingsEndpoint:
         assert "bookings" in data
         assert data["bookings"] == []
     
-    def test_get_bookings_missing_email(self):
+    def test_get_bookings_missing_email(self, client):
         """Test getting bookings without email parameter."""
         response = client.get("/bookings")
         assert response.status_code == 422  # Validation error
@@ -223,21 +180,17 @@ class TestBookingsEndpoint:
 class TestErrorHandling:
     """Test error handling."""
     
-    def test_invalid_json(self):
+    def test_invalid_json(self, client):
         """Test handling of invalid JSON."""
         response = client.post("/book", content="invalid json")
         assert response.status_code == 422
     
-    def test_method_not_allowed(self):
+    def test_method_not_allowed(self, client):
         """Test method not allowed error."""
         response = client.put("/classes")
         assert response.status_code == 405
     
-    def test_not_found(self):
+    def test_not_found(self, client):
         """Test not found error."""
         response = client.get("/nonexistent")
         assert response.status_code == 404
-
-
-if __name__ == "__main__":
-    pytest.main([__file__]) 
\ No newline at end of file
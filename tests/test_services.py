@@ -2,221 +2,170 @@
 Tests for the service layer business logic.
 """
 import pytest
-from datetime import datetime, timedelta
-import pytz
-from unittest.mock import Mock, patch
+from datetime import datetime
+from unittest.mock import MagicMock, Mock
+from zoneinfo import ZoneInfo
 
+from app.database import BookingResult
 from app.models import BookingRequest, FitnessClass
-from app.services import FitnessStudioService
-
-
-class TestFitnessStudioService:
-    """Test the FitnessStudioService class."""
-    
-    def setup_method(self):
-        """Setup method for each test."""
-        self.service = FitnessStudioService()
-    
-    def test_get_all_classes(self):
-        """Test getting all classes."""
-        with patch.object(self.service.db, 'get_all_classes') as mock_get:
-            mock_classes = [
-                FitnessClass(
-                    id=1,
-                    name="Yoga",
-                    date_time=datetime.now(pytz.timezone('Asia/Kolkata')) + timedelta(days=1),
-                    instructor="Sarah Johnson",
-                    available_slots=20,
-                    total_slots=20
-                )
-            ]
-            mock_get.return_value = mock_classes
-            
-            result = self.service.get_all_classes()
-            
-            assert result == mock_classes
-            mock_get.assert_called_once()
-    
-    def test_book_class_success(self):
-        """Test successful booking."""
-        booking_request = BookingRequest(
-            class_id=1,
-            client_name="John Doe",
-            client_email="john@example.com"
-        )
-        
-        mock_class = FitnessClass(
-            id=1,
-            name="Yoga",
-            date_time=datetime.now(pytz.timezone('Asia/Kolkata')) + timedelta(days=1),
-            instructor="Sarah Johnson",
-            available_slots=20,
-            total_slots=20
-        )
-        
-        with patch.object(self.service.db, 'get_class_by_id', return_value=mock_class), \
-             patch.object(self.service.db, 'check_existing_booking', return_value=False), \
-             patch.object(self.service.db, 'create_booking', return_value=12345), \
-             patch.object(self.service.db, 'update_class_slots', return_value=True):
-            
-            result = self.service.book_class(booking_request)
-            
-            assert result.booking_id == 12345
-            assert result.class_name == "Yoga"
-            assert result.client_name == "John Doe"
-            assert result.client_email == "john@example.com"
-            assert "successful" in result.message
-    
-    def test_book_class_not_found(self):
-        """Test booking a non-existent class."""
-        booking_request = BookingRequest(
-            class_id=999,
-            client_name="John Doe",
-            client_email="john@example.com"
-        )
-        
-        with patch.object(self.service.db, 'get_class_by_id', return_value=None):
-            with pytest.raises(KeyError, match="Class with ID 999 not found"):
-                self.service.book_class(booking_request)
-    
-    def test_book_class_full(self):
-        """Test booking a full class."""
-        booking_request = BookingRequest(
-            class_id=1,
-            client_name="John Doe",
-            client_email="john@example.com"
-        )
-        
-        mock_class = FitnessClass(
+
+# Studio timezone and a frozen future timestamp, resolved once for the
+# whole module; no assertion here inspects wall-clock time, so every mock
+# datetime can share this constant. zoneinfo zones attach directly as
+# tzinfo, unlike pytz which needs localize().
+IST = ZoneInfo("Asia/Kolkata")
+FIXED_FUTURE = datetime(2099, 1, 1, 9, 0, tzinfo=IST)
+
+
+@pytest.fixture
+def mock_db(service, monkeypatch):
+    """Swap the service's db for a fresh MagicMock for one test.
+
+    Direct attribute assignment avoids the introspection and save/restore
+    bookkeeping of nested patch.object context managers.
+    """
+    db = MagicMock()
+    monkeypatch.setattr(service, "db", db)
+    return db
+
+
+def make_class(**overrides):
+    """Build a spec'd FitnessClass mock, skipping pydantic validation.
+
+    Mock treats the name kwarg specially, so attributes are assigned after
+    construction.
+    """
+    attrs = {
+        "id": 1,
+        "name": "Yoga",
+        "date_time": FIXED_FUTURE,
+        "instructor": "Sarah Johnson",
+        "available_slots": 20,
+        "total_slots": 20,
+        "timezone": "Asia/Kolkata",
+    }
+    attrs.update(overrides)
+    mock_class = Mock(spec=FitnessClass)
+    for field, value in attrs.items():
+        setattr(mock_class, field, value)
+    return mock_class
+
+
+@pytest.fixture(scope="module")
+def yoga_class():
+    """Canonical upcoming class; tests derive variants via make_class."""
+    return make_class()
+
+
+# Canonical booking requests, validated once at import; BookingRequest is
+# immutable so sharing across tests is safe
+BOOKING_REQUEST = BookingRequest(
+    class_id=1,
+    client_name="John Doe",
+    client_email="john@example.com"
+)
+BOOKING_REQUEST_MISSING = BOOKING_REQUEST.model_copy(update={"class_id": 999})
+
+
+def test_get_all_classes(service, mock_db, yoga_class):
+    """Test getting all classes."""
+    mock_classes = [yoga_class]
+    mock_db.get_all_classes.return_value = mock_classes
+
+    result = service.get_all_classes()
+
+    assert result == mock_classes
+    mock_db.get_all_classes.assert_called_once()
+
+def test_book_class_success(service, mock_db, yoga_class):
+    """Test successful booking."""
+    mock_db.try_book.return_value = BookingResult('ok', 12345, yoga_class)
+
+    result = service.book_class(BOOKING_REQUEST)
+
+    assert result.booking_id == 12345
+    assert result.class_name == "Yoga"
+    assert result.client_name == "John Doe"
+    assert result.client_email == "john@example.com"
+    assert "successful" in result.message
+
+def test_book_class_not_found(service, mock_db):
+    """Test booking a non-existent class."""
+    mock_db.try_book.return_value = BookingResult('not_found', None, None)
+
+    with pytest.raises(KeyError, match="Class with ID 999 not found"):
+        service.book_class(BOOKING_REQUEST_MISSING)
+
+def test_book_class_full(service, mock_db):
+    """Test booking a full class."""
+    full_class = make_class(available_slots=0)
+    mock_db.try_book.return_value = BookingResult('full', None, full_class)
+
+    with pytest.raises(ValueError, match="This class is full"):
+        service.book_class(BOOKING_REQUEST)
+
+def test_book_class_already_booked(service, mock_db, yoga_class):
+    """Test booking a class that's already booked by the same email."""
+    mock_db.try_book.return_value = BookingResult('duplicate', None, yoga_class)
+
+    with pytest.raises(ValueError, match="already booked"):
+        service.book_class(BOOKING_REQUEST)
+
+def test_get_bookings_by_email(service, mock_db):
+    """Test getting bookings by email."""
+    mock_bookings = [
+        Mock(
             id=1,
-            name="Yoga",
-            date_time=datetime.now(pytz.timezone('Asia/Kolkata')) + timedelta(days=1),
-            instructor="Sarah Johnson",
-            available_slots=0,  # Full class
-            total_slots=20
-        )
-        
-        with patch.object(self.service.db, 'get_class_by_id', return_value=mock_class):
-            with pytest.raises(ValueError, match="This class is full"):
-                self.service.book_class(booking_request)
-    
-    def test_book_class_already_booked(self):
-        """Test booking a class that's already booked by the same email."""
-        booking_request = BookingRequest(
             class_id=1,
+            class_name="Yoga",
             client_name="John Doe",
-            client_email="john@example.com"
-        )
-        
-        mock_class = FitnessClass(
-            id=1,
-            name="Yoga",
-            date_time=datetime.now(pytz.timezone('Asia/Kolkata')) + timedelta(days=1),
-            instructor="Sarah Johnson",
-            available_slots=20,
-            total_slots=20
-        )
-        
-        with patch.object(self.service.db, 'get_class_by_id', return_value=mock_class), \
-             patch.object(self.service.db, 'check_existing_booking', return_value=True):
-            
-            with pytest.raises(ValueError, match="already booked"):
-                self.service.book_class(booking_request)
-    
-    def test_get_bookings_by_email(self):
-        """Test getting bookings by email."""
-        with patch.object(self.service.db, 'get_bookings_by_email') as mock_get:
-            mock_bookings = [
-                Mock(
-                    id=1,
-                    class_id=1,
-                    class_name="Yoga",
-                    client_name="John Doe",
-                    client_email="john@example.com",
-                    booking_date=datetime.now(pytz.timezone('Asia/Kolkata')),
-                    created_at=datetime.now(pytz.timezone('Asia/Kolkata'))
-                )
-            ]
-            mock_get.return_value = mock_bookings
-            
-            result = self.service.get_bookings_by_email("john@example.com")
-            
-            assert result == mock_bookings
-            mock_get.assert_called_once_with("john@example.com")
-    
-    def test_get_class_details_found(self):
-        """Test getting class details when class exists."""
-        mock_class = FitnessClass(
-            id=1,
-            name="Yoga",
-            date_time=datetime.now(pytz.timezone('Asia/Kolkata')) + timedelta(days=1),
-            instructor="Sarah Johnson",
-            available_slots=20,
-            total_slots=20
-        )
-        
-        with patch.object(self.service.db, 'get_class_by_id', return_value=mock_class):
-            result = self.service.get_class_details(1)
-            
-            assert result == mock_class
-            self.service.db.get_class_by_id.assert_called_once_with(1)
-    
-    def test_get_class_details_not_found(self):
-        """Test getting class details when class doesn't exist."""
-        with patch.object(self.service.db, 'get_class_by_id', return_value=None):
-            result = self.service.get_class_details(999)
-            
-            assert result is None
-            self.service.db.get_class_by_id.assert_called_once_with(999)
-    
-    def test_check_class_availability_available(self):
-        """Test checking availability for an available class."""
-        mock_class = FitnessClass(
-            id=1,
-            name="Yoga",
-            date_time=datetime.now(pytz.timezone('Asia/Kolkata')) + timedelta(days=1),
-            instructor="Sarah Johnson",
-            available_slots=5,
-            total_slots=20
+            client_email="john@example.com",
+            booking_date=FIXED_FUTURE,
+            created_at=FIXED_FUTURE
         )
-        
-        with patch.object(self.service.db, 'get_class_by_id', return_value=mock_class):
-            result = self.service.check_class_availability(1)
-            
-            assert result["available"] is True
-            assert result["available_slots"] == 5
-            assert result["total_slots"] == 20
-            assert result["class_name"] == "Yoga"
-    
-    def test_check_class_availability_full(self):
-        """Test checking availability for a full class."""
-        mock_class = FitnessClass(
-            id=1,
-            name="Yoga",
-            date_time=datetime.now(pytz.timezone('Asia/Kolkata')) + timedelta(days=1),
-            instructor="Sarah Johnson",
-            available_slots=0,
-            total_slots=20
-        )
-        
-        with patch.object(self.service.db, 'get_class_by_id', return_value=mock_class):
-            result = self.service.check_class_availability(1)
-            
-            assert result["available"] is False
-            assert result["available_slots"] == 0
-            assert result["total_slots"] == 20
-            assert "full" in result["message"]
-    
-    def test_check_class_availability_not_found(self):
-        """Test checking availability for a non-existent class."""
-        with patch.object(self.service.db, 'get_class_by_id', return_value=None):
-            result = self.service.check_class_availability(999)
-            
-            assert result["available"] is False
-            assert result["available_slots"] == 0
-            assert result["total_slots"] == 0
-            assert "not found" in result["message"]
-
-
-if __name__ == "__main__":
-    pytest.main([__file__]) 
\ No newline at end of file
+    ]
+    mock_db.get_bookings_by_email.return_value = mock_bookings
+
+    result = service.get_bookings_by_email("john@example.com")
+
+    assert result == mock_bookings
+    mock_db.get_bookings_by_email.assert_called_once_with("john@example.com")
+
+def test_get_class_details_found(service, mock_db, yoga_class):
+    """Test getting class details when class exists."""
+    mock_db.get_class_by_id.return_value = yoga_class
+
+    result = service.get_class_details(1)
+
+    assert result == yoga_class
+    mock_db.get_class_by_id.assert_called_once_with(1)
+
+def test_get_class_details_not_found(service, mock_db):
+    """Test getting class details when class doesn't exist."""
+    mock_db.get_class_by_id.return_value = None
+
+    result = service.get_class_details(999)
+
+    assert result is None
+    mock_db.get_class_by_id.assert_called_once_with(999)
+
+@pytest.mark.parametrize("slots,expected_available,msg_substr", [
+    (5, True, None),        # open class
+    (0, False, "full"),     # full class
+    (None, False, "not found"),  # non-existent class
+])
+def test_check_class_availability(service, mock_db, yoga_class,
+                                  slots, expected_available, msg_substr):
+    """Test checking availability for open, full and missing classes."""
+    mock_class = None if slots is None else make_class(available_slots=slots)
+    mock_db.get_class_by_id.return_value = mock_class
+
+    result = service.check_class_availability(1)
+
+    assert result["available"] is expected_available
+    assert result["available_slots"] == (slots or 0)
+    assert result["total_slots"] == (0 if slots is None else 20)
+    if msg_substr is None:
+        assert result["class_name"] == "Yoga"
+    else:
+        assert msg_substr in result["message"]